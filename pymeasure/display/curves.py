@@ -23,22 +23,39 @@
 #
 
 import logging
+import math
+from functools import lru_cache
 
 import numpy as np
 import pyqtgraph as pg
-from .Qt import QtCore, QtGui
+from .Qt import QtCore, QtGui, QtWidgets
 
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
 
+@lru_cache(maxsize=None)
+def _get_colormap_lut(name):
+    """ Returns the 1024 entry RGBA byte lookup table of a pyqtgraph colormap.
+    The table is shared between all images using the colormap and is read-only.
+    """
+    lut = pg.colormap.get(name).getLookupTable(nPts=1024, alpha=True, mode='byte')
+    lut.flags.writeable = False
+    return lut
+
+
 class ResultsCurve(pg.PlotDataItem):
     """ Creates a curve loaded dynamically from a file through the Results object. The data can
     be forced to fully reload on each update, useful for cases when the data is changing across
     the full file instead of just appending.
+
+    Large curves are downsampled to the minimum and maximum values per pixel, as long as
+    the x data is increasing, ignoring missing (NaN) values. This can be disabled with the
+    ``autoDownsample=False`` keyword.
     """
 
     def __init__(self, results, x, y, force_reload=False, wdg=None, **kwargs):
+        self._auto_downsample = kwargs.pop('autoDownsample', True)
         super().__init__(**kwargs)
         self.results = results
         self.wdg = wdg
@@ -46,6 +63,14 @@ class ResultsCurve(pg.PlotDataItem):
         self.x, self.y = x, y
         self.force_reload = force_reload
         self.color = self.opts['pen'].color()
+        # x-y data of the rows read so far, the capacity grows as needed
+        self._buffer = np.empty((2, 0))
+        self._length = 0
+        self._columns = (x, y)
+        self._x_increasing = True
+        self._last_x = -np.inf  # last finite x value read so far
+        # Keep the drawn curve as pixmap, so that moving crosshairs do not redraw it
+        self.curve.setCacheMode(QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
     def update_data(self):
         """Updates the data by polling the results"""
@@ -53,8 +78,39 @@ class ResultsCurve(pg.PlotDataItem):
             self.results.reload()
         data = self.results.data  # get the current snapshot
 
+        columns = (self.x, self.y)
+        if columns != self._columns or len(data) < self._length or self.force_reload:
+            self._length = 0  # read all rows again
+            self._columns = columns
+            self._x_increasing = True
+            self._last_x = -np.inf
+        elif len(data) == self._length:
+            return  # no new data since the last update
+
+        # Append the new rows to the buffer
+        new = data.iloc[self._length:]
+        length = len(data)
+        if length > self._buffer.shape[1]:
+            buffer = np.empty((2, max(4 * length, 1024)))
+            buffer[:, :self._length] = self._buffer[:, :self._length]
+            self._buffer = buffer
+        self._buffer[0, self._length:length] = new[self.x].to_numpy(dtype=float)
+        self._buffer[1, self._length:length] = new[self.y].to_numpy(dtype=float)
+
+        # Downsampling assumes increasing x, check it for the finite x of the new rows only
+        x = self._buffer[0, self._length:length]
+        x = x[np.isfinite(x)]
+        x_increasing = self._x_increasing and bool(
+            np.all(np.diff(x, prepend=self._last_x) >= 0))
+        if len(x):
+            self._last_x = x[-1]
+        if self._auto_downsample and x_increasing != self.opts['autoDownsample']:
+            self.setDownsampling(auto=x_increasing)
+        self._x_increasing = x_increasing
+        self._length = length
+
         # Set x-y data
-        self.setData(data[self.x], data[self.y])
+        self.setData(self._buffer[0, :length], self._buffer[1, :length])
 
     def set_color(self, color):
         self.pen.setColor(color)
@@ -82,11 +138,14 @@ class ResultsImage(pg.ImageItem):
         self.yend = getattr(self.results.procedure, self.y + '_end')
         self.ystep = getattr(self.results.procedure, self.y + '_step')
         self.ysize = int(np.ceil((self.yend - self.ystart) / self.ystep)) + 1
-        self.img_data = np.zeros((self.ysize, self.xsize, 4))
+        # RGBA bytes, pyqtgraph assumes column-major order so the image is indexed as [x, y]
+        self.img_data = np.zeros((self.xsize, self.ysize, 4), dtype=np.uint8)
         self.force_reload = force_reload
         self.cm = pg.colormap.get('viridis')
+        self._colormap_lut = _get_colormap_lut('viridis')
+        self._reset_image()
 
-        super().__init__(image=self.img_data)
+        super().__init__(image=self.img_data, levels=(0, 255))
 
         # Scale and translate image so that the pixels are in the correct
         # position in "data coordinates"
@@ -97,22 +156,54 @@ class ResultsImage(pg.ImageItem):
         self.setTransform(tr)
 
     def update_data(self):
+        """ Updates the image with the rows added since the last update. The colors of
+        previously drawn pixels are only recomputed when the range of z expands.
+        """
         if self.force_reload:
             self.results.reload()
 
         data = self.results.data
-        zmin = data[self.z].min()
-        zmax = data[self.z].max()
-
-        # populate the image array with the new data
-        for idx, row in data.iterrows():
-            xdat = row[self.x]
-            ydat = row[self.y]
-            xidx, yidx = self.find_img_index(xdat, ydat)
-            self.img_data[yidx, xidx, :] = self.colormap((row[self.z] - zmin) / (zmax - zmin))
 
-        # set image data, need to transpose since pyqtgraph assumes column-major order
-        self.setImage(image=np.transpose(self.img_data, axes=(1, 0, 2)))
+        columns = (self.x, self.y, self.z)
+        if columns != self._columns or len(data) < self._last_row or self.force_reload:
+            self._reset_image()
+            self._columns = columns
+        elif len(data) == self._last_row:
+            return  # no new data since the last update
+
+        new = data.iloc[self._last_row:]
+        self._last_row = len(data)
+
+        if len(new) > 0:
+            xidx, yidx = self.find_img_indices(new[self.x].to_numpy(dtype=float),
+                                               new[self.y].to_numpy(dtype=float))
+            zs = new[self.z].to_numpy(dtype=float)
+
+            self._z_data[xidx, yidx] = zs
+            self._mask[xidx, yidx] = True
+
+            zmin = np.fmin.reduce(zs, initial=self._zmin)
+            zmax = np.fmax.reduce(zs, initial=self._zmax)
+            if zmin != self._zmin or zmax != self._zmax:
+                # the z range changed, so all drawn pixels need new colors
+                self._zmin, self._zmax = zmin, zmax
+                self.img_data[self._mask] = self.colormap_bytes(
+                    (self._z_data[self._mask] - zmin) / (zmax - zmin))
+            else:
+                self.img_data[xidx, yidx, :] = self.colormap_bytes(
+                    (self._z_data[xidx, yidx] - zmin) / (zmax - zmin))
+
+        self.setImage(image=self.img_data, levels=(0, 255))
+
+    def _reset_image(self):
+        """ Clears the image so that the next update redraws all the data """
+        self.img_data[:] = 0
+        self._z_data = np.full((self.xsize, self.ysize), np.nan)
+        self._mask = np.zeros((self.xsize, self.ysize), dtype=bool)
+        self._zmin = np.inf
+        self._zmax = -np.inf
+        self._last_row = 0
+        self._columns = (self.x, self.y, self.z)
 
     def find_img_index(self, x, y):
         """ Finds the integer image indices corresponding to the
@@ -127,22 +218,48 @@ class ResultsImage(pg.ImageItem):
 
         return indices
 
+    def find_img_indices(self, x, y):
+        """ Array version of :meth:`find_img_index`, returns the integer image
+        indices of the closest x and y points for arrays of x and y data.
+        """
+        with np.errstate(invalid='ignore'):  # NaN values go to the final pixel
+            xidx = np.where((self.xstart <= x) & (x <= self.xend),
+                            np.floor((x - self.xstart) / self.xstep + 0.5),
+                            self.xsize - 1).astype(np.intp)
+            yidx = np.where((self.ystart <= y) & (y <= self.yend),
+                            np.floor((y - self.ystart) / self.ystep + 0.5),
+                            self.ysize - 1).astype(np.intp)
+
+        return xidx, yidx
+
     def round_up(self, x):
         """Convenience function since numpy rounds to even"""
-        if x % 1 >= 0.5:
-            return int(x) + 1
-        else:
-            return int(x)
+        return math.floor(x + 0.5)
 
     def colormap(self, x):
         """ Return mapped color as 0.0-1.0 floats RGBA """
         return self.cm.map(x, mode='float')
 
+    def colormap_bytes(self, x):
+        """ Return mapped colors of an array as 0-255 RGBA bytes using the lookup table,
+        NaN values are mapped to transparent pixels
+        """
+        n = len(self._colormap_lut) - 1
+        nan = np.isnan(x)
+        idx = np.clip(np.floor(np.where(nan, 0, x) * n + 0.5), 0, n).astype(np.intp)
+        colors = self._colormap_lut[idx]
+        colors[nan] = 0
+        return colors
+
     # TODO: colormap selection
 
 
 class BufferCurve(pg.PlotDataItem):
     """ Creates a curve based on a predefined buffer size and allows data to be added dynamically.
+
+    The curve is redrawn in batches of appended points, and the remaining points are drawn
+    once control returns to the event loop or when :meth:`flush` is called. The
+    :attr:`data_updated` signal is emitted after each redraw rather than after each append.
     """
 
     data_updated = QtCore.Signal()
@@ -150,24 +267,43 @@ class BufferCurve(pg.PlotDataItem):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self._buffer = None
+        self._flush_pending = False
 
     def prepare(self, size, dtype=np.float32):
-        """ Prepares the buffer based on its size, data type """
-        self._buffer = np.empty((size, 2), dtype=dtype)
+        """ Prepares the buffer based on its size, data type. For large buffers
+        the curve is only redrawn every ``size // 1024`` points and when full.
+        """
+        # x and y are stored in separate rows, so that their slices are contiguous
+        self._buffer = np.empty((2, size), dtype=dtype)
         self._ptr = 0
+        self._drawn = 0
+        self._update_every = max(1, size // 1024)
 
     def append(self, x, y):
         """ Appends data to the curve with optional errors """
         if self._buffer is None:
             raise Exception("BufferCurve buffer must be prepared")
-        if len(self._buffer) <= self._ptr:
+        if self._buffer.shape[1] <= self._ptr:
             raise Exception("BufferCurve overflow")
 
         # Set x-y data
-        self._buffer[self._ptr, :2] = [x, y]
-        self.setData(self._buffer[:self._ptr, :2])
-
+        self._buffer[:, self._ptr] = x, y
         self._ptr += 1
+
+        if self._ptr % self._update_every == 0 or self._ptr == self._buffer.shape[1]:
+            self.flush()
+        elif not self._flush_pending:
+            # Draw the points of an incomplete batch once the event loop is idle
+            self._flush_pending = True
+            QtCore.QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """ Redraws the curve with all appended points, if any are not drawn yet """
+        self._flush_pending = False
+        if self._buffer is None or self._drawn == self._ptr:
+            return
+        self.setData(x=self._buffer[0, :self._ptr], y=self._buffer[1, :self._ptr])
+        self._drawn = self._ptr
         self.data_updated.emit()
 
 
@@ -45,10 +45,9 @@ class ImageFrame(PlotFrame):
         self.change_z_axis(z_axis)
 
     def change_z_axis(self, axis):
-        for item in self.plot.items:
-            if isinstance(item, self.ResultsClass):
-                item.z = axis
-                item.update_data()
+        for item in self.plot.results_items:
+            item.z = axis
+            item.update_data()
         label, units = self.parse_axis(axis)
         if units is not None:
             self.plot.setTitle(label + ' (%s)' % units)
@@ -59,8 +59,7 @@ class ImageWidget(TabWidget, QtWidgets.QWidget):
         self.columns_z_label.setText('Z Axis:')
 
         self.columns_z = QtWidgets.QComboBox(self)
-        for column in self.columns:
-            self.columns_z.addItem(column)
+        self.columns_z.addItems(list(self.columns))
         self.columns_z.activated.connect(self.update_z_column)
 
         self.image_frame = ImageFrame(
@@ -25,6 +25,9 @@
 import logging
 
 import re
+import weakref
+from functools import lru_cache
+
 import pyqtgraph as pg
 
 from ..curves import ResultsCurve, Crosshairs
@@ -34,13 +37,57 @@ from ...experiment import Procedure
 log = logging.getLogger(__name__)
 log.addHandler(logging.NullHandler())
 
+_UNITS_PATTERN = re.compile(r"\((?P<units>\w+)\)")
+
+
+@lru_cache(maxsize=256)
+def _parse_axis(axis):
+    if not isinstance(axis, str):
+        return axis, None
+    match = _UNITS_PATTERN.search(axis)
+    if not match:
+        return axis, None
+    return _UNITS_PATTERN.sub('', axis), match.group('units')
+
+
+class ResultsPlotItem(pg.PlotItem):
+    """ Extends the PyQtGraph PlotItem to keep track of the contained items
+    of a results class, e.g. :class:`ResultsCurve<pymeasure.display.curves.ResultsCurve>`,
+    so that they can be updated without searching through all plot items
+    """
+
+    def __init__(self, results_class, **kwargs):
+        super().__init__(**kwargs)
+        self.results_class = results_class
+        self.results_items = []
+
+    def addItem(self, item, *args, **kwargs):
+        super().addItem(item, *args, **kwargs)
+        if isinstance(item, self.results_class) and item not in self.results_items:
+            self.results_items.append(item)
+
+    def removeItem(self, item):
+        super().removeItem(item)
+        if item in self.results_items:
+            self.results_items.remove(item)
+
 
 class PlotFrame(QtWidgets.QFrame):
     """ Combines a PyQtGraph Plot with Crosshairs. Refreshes
     the plot based on the refresh_time, and allows the axes
-    to be changed on the fly, which updates the plotted data
+    to be changed on the fly, which updates the plotted data.
+    The refreshing is limited to the refresh rate of the screen
+    and only happens while the frame is shown. Frames with the same refresh
+    interval share a single timer, so that they are refreshed together,
+    which is stopped as soon as none of the frames is shown anymore.
+
+    The ``timer`` attribute is ``None`` until the frame is shown. As the timer is shared
+    with other frames, change the ``refresh_time`` instead of retiming the timer.
     """
 
+    _timers = {}  # Shared refresh timers by their interval in ms
+    _timer_frames = {}  # Frames connected to each shared timer
+    _crosshairs_pen = None  # Created once, as the crosshair lines copy it
     LABEL_STYLE = {'font-size': '10pt', 'font-family': 'Arial', 'color': '#000000'}
     updated = QtCore.Signal()
     ResultsClass = ResultsCurve
@@ -64,72 +111,105 @@ class PlotFrame(QtWidgets.QFrame):
 
         vbox = QtWidgets.QVBoxLayout(self)
 
-        self.plot_widget = pg.PlotWidget(self, background='#ffffff')
+        self.plot = ResultsPlotItem(self.ResultsClass)
+        self.plot_widget = pg.PlotWidget(self, background='#ffffff', plotItem=self.plot)
         vbox.addWidget(self.plot_widget)
         self.setLayout(vbox)
 
-        self.plot = self.plot_widget.getPlotItem()
-
         style = dict(self.LABEL_STYLE, justify='right')
         if "font-size" in style:  # LabelItem wants the size as 'size' rather than 'font-size'
             style["size"] = style.pop("font-size")
         self.coordinates = pg.LabelItem("", parent=self.plot, **style)
         self.coordinates.anchor(itemPos=(1, 1), parentPos=(1, 1), offset=(0, 3))
 
-        self.crosshairs = Crosshairs(self.plot,
-                                     pen=pg.mkPen(color='#AAAAAA',
-                                                  style=QtCore.Qt.PenStyle.DashLine))
+        if PlotFrame._crosshairs_pen is None:
+            PlotFrame._crosshairs_pen = pg.mkPen(color='#AAAAAA',
+                                                 style=QtCore.Qt.PenStyle.DashLine)
+        self.crosshairs = Crosshairs(self.plot, pen=PlotFrame._crosshairs_pen)
         self.crosshairs.coordinates.connect(self.update_coordinates)
 
-        self.timer = QtCore.QTimer(self)
-        self.timer.timeout.connect(self.update_curves)
-        self.timer.timeout.connect(self.crosshairs.update)
-        self.timer.timeout.connect(self.updated)
-        self.timer.start(int(self.refresh_time * 1e3))
+        self.timer = None  # connected to a shared refresh timer while shown
+
+    def _start_refreshing(self):
+        """ Connects the frame to the shared timer of its refresh interval """
+        self._stop_refreshing()
+        interval = self._refresh_interval()
+        timer = PlotFrame._timers.get(interval)
+        if timer is None:
+            # The application owns the timer, as it outlives the frames using it
+            timer = QtCore.QTimer(QtCore.QCoreApplication.instance())
+            PlotFrame._timers[interval] = timer
+            PlotFrame._timer_frames[interval] = weakref.WeakSet()
+        if not timer.isActive():
+            timer.start(interval)
+        timer.timeout.connect(self._refresh)
+        PlotFrame._timer_frames[interval].add(self)
+        self.timer = timer
+        self._timer_interval = interval
+
+    def _stop_refreshing(self):
+        """ Disconnects the frame from its refresh timer """
+        if self.timer is not None:
+            self.timer.timeout.disconnect(self._refresh)
+            frames = PlotFrame._timer_frames[self._timer_interval]
+            frames.discard(self)
+            if not frames:
+                self.timer.stop()  # no frame is left to refresh
+            self.timer = None
+
+    def _refresh(self):
+        self.update_curves()
+        self.crosshairs.update()
+        self.updated.emit()
+
+    def _refresh_interval(self):
+        """ Returns the refresh interval in ms, limited to the refresh rate of the screen """
+        refresh_time = self.refresh_time
+        screen = self.screen() if hasattr(self, 'screen') else None
+        if screen is not None and screen.refreshRate() > 0:
+            refresh_time = max(refresh_time, 1 / screen.refreshRate())
+        return int(refresh_time * 1e3)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self._start_refreshing()  # the frame might be on another screen
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        if not event.spontaneous():  # keep refreshing minimized windows
+            self._stop_refreshing()
 
     def update_coordinates(self, x, y):
         self.coordinates.setText(f"({x:g}, {y:g})")
 
     def update_curves(self):
-        for item in self.plot.items:
-            if isinstance(item, self.ResultsClass):
-                if self.check_status:
-                    if item.results.procedure.status == Procedure.RUNNING:
-                        item.update_data()
-                else:
+        if not self.isVisible():
+            return
+        for item in self.plot.results_items:
+            if self.check_status:
+                if item.results.procedure.status == Procedure.RUNNING:
                     item.update_data()
+            else:
+                item.update_data()
 
     def parse_axis(self, axis):
         """ Returns the units of an axis by searching the string
         """
-        units_pattern = r"\((?P<units>\w+)\)"
-        try:
-            match = re.search(units_pattern, axis)
-        except TypeError:
-            match = None
-
-        if match:
-            if 'units' in match.groupdict():
-                label = re.sub(units_pattern, '', axis)
-                return label, match.groupdict()['units']
-        else:
-            return axis, None
+        return _parse_axis(axis)
 
     def change_x_axis(self, axis):
-        for item in self.plot.items:
-            if isinstance(item, self.ResultsClass):
-                item.x = axis
-                item.update_data()
+        for item in self.plot.results_items:
+            item.x = axis
+            item.update_data()
         label, units = self.parse_axis(axis)
         self.plot.setLabel('bottom', label, units=units, **self.LABEL_STYLE)
         self.x_axis = axis
         self.x_axis_changed.emit(axis)
 
     def change_y_axis(self, axis):
-        for item in self.plot.items:
-            if isinstance(item, self.ResultsClass):
-                item.y = axis
-                item.update_data()
+        for item in self.plot.results_items:
+            item.y = axis
+            item.update_data()
         label, units = self.parse_axis(axis)
         self.plot.setLabel('left', label, units=units, **self.LABEL_STYLE)
         self.y_axis = axis
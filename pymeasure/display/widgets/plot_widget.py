@@ -66,9 +66,8 @@ class PlotWidget(TabWidget, QtWidgets.QWidget):
 
         self.columns_x = QtWidgets.QComboBox(self)
         self.columns_y = QtWidgets.QComboBox(self)
-        for column in self.columns:
-            self.columns_x.addItem(column)
-            self.columns_y.addItem(column)
+        self.columns_x.addItems(list(self.columns))
+        self.columns_y.addItems(list(self.columns))
         self.columns_x.activated.connect(self.update_x_column)
         self.columns_y.activated.connect(self.update_y_column)
 
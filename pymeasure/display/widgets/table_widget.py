@@ -634,13 +634,11 @@ class TableWidget(TabWidget, QtWidgets.QWidget):
         self.column_index_combo = QtWidgets.QComboBox(self)
         self.layout = QtWidgets.QComboBox(self)
         self.column_index_combo.addItem('<None>')
-        for column in self.columns:
-            self.column_index_combo.addItem(column)
+        self.column_index_combo.addItems(list(self.columns))
         if self.column_index is not None:
             self.column_index_combo.setCurrentText(self.column_index)
 
-        for key in self.layout_names:
-            self.layout.addItem(key)
+        self.layout.addItems(self.layout_names)
         self.layout.setCurrentText(self.table_layout)
 
         self.column_index_combo.activated.connect(self.update_column_index)
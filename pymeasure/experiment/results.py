@@ -216,6 +216,7 @@ class Results:
         self.parameters = procedure.parameter_objects()
         self._header_count = -1
         self._metadata_count = -1
+        self._data_file_stat = None
 
         self.formatter = CSVFormatter(columns=self.procedure.DATA_COLUMNS)
 
@@ -441,6 +442,9 @@ class Results:
                 # Empty dataframe
                 self._data = pd.DataFrame(columns=self.procedure.DATA_COLUMNS)
         else:  # Concatenate additional data, if any, to already loaded data
+            file_stat = self._stat_data_file()
+            if file_stat is not None and file_stat == self._data_file_stat:
+                return self._data  # File unchanged since it was last read
             skiprows = len(self._data) + self._header_count
             chunks = pd.read_csv(
                 self.data_filename,
@@ -460,12 +464,14 @@ class Results:
                                            ignore_index=True)
             except Exception:
                 pass  # All data is up to date
+            self._data_file_stat = file_stat
         return self._data
 
     def reload(self):
         """ Preforms a full reloading of the file data, neglecting
         any changes in the comments
         """
+        self._data_file_stat = self._stat_data_file()
         chunks = pd.read_csv(
             self.data_filename,
             comment=Results.COMMENT,
@@ -477,6 +483,16 @@ class Results:
         except Exception:
             self._data = chunks.read()
 
+    def _stat_data_file(self):
+        """ Returns the modification time and size of the data file, which
+        identify whether it changed since it was last read
+        """
+        try:
+            file_stat = os.stat(self.data_filename)
+        except (OSError, TypeError):
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
     def __repr__(self):
         return "<{}(filename='{}',procedure={},shape={})>".format(
             self.__class__.__name__, self.data_filename,
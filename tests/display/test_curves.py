@@ -0,0 +1,192 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import pyqtgraph as pg
+
+from pymeasure.display.Qt import QtWidgets
+from pymeasure.display.curves import ResultsCurve, ResultsImage, BufferCurve
+
+
+@pytest.fixture()
+def results():
+    results = mock.MagicMock()
+    procedure = results.procedure
+    procedure.x_start, procedure.x_end, procedure.x_step = 0., 1., 0.1
+    procedure.y_start, procedure.y_end, procedure.y_step = -1., 1., 0.25
+    results.data = pd.DataFrame({'x': [], 'y': [], 'z': []})
+    return results
+
+
+@pytest.fixture()
+def image(qtbot, results):
+    return ResultsImage(results, 'x', 'y', 'z')
+
+
+def test_results_curve_appends_new_rows(results):
+    curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen())
+    for length in (0, 5, 2000, 2001):
+        results.data = pd.DataFrame({'x': np.arange(length), 'y': -np.arange(length)})
+        curve.update_data()
+        x, y = curve.getData()
+        if length:
+            assert x.tolist() == list(range(length))
+            assert y.tolist() == [-i for i in range(length)]
+    curve.y = 'x'
+    curve.update_data()
+    assert curve.getData()[1].tolist() == list(range(2001))
+
+
+def test_results_curve_is_cached(results):
+    curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen())
+    assert (curve.curve.cacheMode()
+            == QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+
+@pytest.mark.parametrize("auto_downsample", (True, False))
+def test_results_curve_downsamples_increasing_x(results, auto_downsample):
+    curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen(), autoDownsample=auto_downsample)
+    results.data = pd.DataFrame({'x': [0., 1., 1., 2.], 'y': [0., 1., 2., 3.]})
+    curve.update_data()
+    assert curve.opts['autoDownsample'] is auto_downsample
+    results.data = pd.DataFrame({'x': [0., 1., 1., 2., 1.], 'y': [0., 1., 2., 3., 4.]})
+    curve.update_data()
+    assert curve.opts['autoDownsample'] is False
+
+
+def test_results_curve_downsampling_ignores_nan_x(results):
+    curve = ResultsCurve(results, 'x', 'y', pen=pg.mkPen())
+    results.data = pd.DataFrame({'x': [0., np.nan, 1.], 'y': [0., 1., 2.]})
+    curve.update_data()
+    assert curve.opts['autoDownsample'] is True
+    results.data = pd.DataFrame({'x': [0., np.nan, 1., np.nan, 2.], 'y': [0., 1., 2., 3., 4.]})
+    curve.update_data()
+    assert curve.opts['autoDownsample'] is True
+    results.data = pd.DataFrame({'x': [0., np.nan, 1., np.nan, 2., np.nan, 0.5],
+                                 'y': [0., 1., 2., 3., 4., 5., 6.]})
+    curve.update_data()
+    assert curve.opts['autoDownsample'] is False
+
+
+def test_find_img_indices_matches_find_img_index(image):
+    x = np.array([0., 0.04, 0.05, 0.96, 1., -0.1, 1.1, np.nan])
+    y = np.array([-1., -0.9, -0.875, 0.5, 1., -1.5, 1.5, np.nan])
+    xidx, yidx = image.find_img_indices(x, y)
+    expected = [image.find_img_index(xi, yi) for xi, yi in zip(x, y)]
+    assert xidx.tolist() == [e[0] for e in expected]
+    assert yidx.tolist() == [e[1] for e in expected]
+
+
+def color(image, x):
+    return image.cm.map(x, mode='byte').astype(int)
+
+
+def test_colormap_bytes(image):
+    x = np.array([0., 0.25, 0.5, 1., -1., 2., np.nan])
+    colors = image.colormap_bytes(x)
+    assert colors.dtype == np.uint8
+    np.testing.assert_allclose(colors[:6], color(image, np.clip(x[:6], 0, 1)), atol=1)
+    assert colors[6].tolist() == [0, 0, 0, 0]
+
+
+def test_update_data_colors_pixels(image, results):
+    results.data = pd.DataFrame({'x': [0., 1.], 'y': [-1., 1.], 'z': [0., 1.]})
+    image.update_data()
+    assert image.image.shape == (image.xsize, image.ysize, 4)
+    np.testing.assert_allclose(image.image[0, 0], color(image, 0.), atol=1)
+    np.testing.assert_allclose(image.image[-1, -1], color(image, 1.), atol=1)
+    assert image.image[1:-1, 1:-1].sum() == 0
+
+
+def test_update_data_only_adds_new_rows(image, results):
+    results.data = pd.DataFrame({'x': [0., 1.], 'y': [-1., 1.], 'z': [0., 1.]})
+    image.update_data()
+    # a new row within the existing z range does not recolor other pixels
+    results.data = pd.DataFrame({'x': [0., 1., 0.5], 'y': [-1., 1., 0.], 'z': [0., 1., 0.5]})
+    image.update_data()
+    np.testing.assert_allclose(image.image[5, 4], color(image, 0.5), atol=1)
+    # a new row outside the z range recolors all drawn pixels
+    results.data = pd.DataFrame({'x': [0., 1., 0.5, 0.1], 'y': [-1., 1., 0., 0.],
+                                 'z': [0., 1., 0.5, 2.]})
+    image.update_data()
+    np.testing.assert_allclose(image.image[-1, -1], color(image, 0.5), atol=1)
+    np.testing.assert_allclose(image.image[1, 4], color(image, 1.), atol=1)
+
+
+def test_update_data_skipped_without_new_rows(image, results):
+    results.data = pd.DataFrame({'x': [0., 1.], 'y': [-1., 1.], 'z': [0., 1.]})
+    image.update_data()
+    with mock.patch.object(image, 'setImage') as set_image:
+        image.update_data()
+        set_image.assert_not_called()
+        image.z = 'x'
+        image.update_data()
+        set_image.assert_called_once()
+
+
+@pytest.mark.parametrize("size, redraws", ((10, 10), (4096, 1024)))
+def test_buffer_curve_append(qtbot, size, redraws):
+    curve = BufferCurve()
+    curve.prepare(size)
+    updated = mock.MagicMock()
+    curve.data_updated.connect(updated)
+    for i in range(size):
+        curve.append(i, 2 * i)
+    assert updated.call_count == redraws
+    x, y = curve.getData()
+    assert x.tolist() == list(range(size))
+    assert y.tolist() == [2 * i for i in range(size)]
+    with pytest.raises(Exception, match="overflow"):
+        curve.append(0, 0)
+
+
+@pytest.mark.parametrize("size, appended", ((5000, 3), (100000, 50050)))
+def test_buffer_curve_draws_incomplete_batch(qtbot, size, appended):
+    curve = BufferCurve()
+    curve.prepare(size)
+    for i in range(appended):
+        curve.append(i, 2 * i)
+    assert curve.getData()[0] is None or len(curve.getData()[0]) < appended
+    qtbot.wait(10)  # let the scheduled redraw run
+    assert len(curve.getData()[0]) == appended
+    assert curve.getData()[1][-1] == 2 * (appended - 1)
+
+
+def test_buffer_curve_flush(qtbot):
+    curve = BufferCurve()
+    curve.prepare(5000)
+    updated = mock.MagicMock()
+    curve.data_updated.connect(updated)
+    for i in range(3):
+        curve.append(i, 2 * i)
+    curve.flush()
+    assert curve.getData()[0].tolist() == [0, 1, 2]
+    updated.assert_called_once()
+    qtbot.wait(10)  # the scheduled redraw has nothing left to draw
+    updated.assert_called_once()
@@ -0,0 +1,131 @@
+#
+# This file is part of the PyMeasure package.
+#
+# Copyright (c) 2013-2024 PyMeasure Developers
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+#
+
+from unittest import mock
+
+import pandas as pd
+import pyqtgraph as pg
+import pytest
+
+from pymeasure.display.curves import ResultsCurve
+from pymeasure.display.widgets.plot_frame import PlotFrame
+
+
+@pytest.fixture()
+def plot_frame(qtbot):
+    frame = PlotFrame('Time (s)', 'Voltage (V)')
+    qtbot.addWidget(frame)
+    return frame
+
+
+@pytest.fixture()
+def curve():
+    results = mock.MagicMock()
+    results.data = pd.DataFrame({'Time (s)': [0., 1.], 'Voltage (V)': [2., 3.]})
+    return ResultsCurve(results, 'Time (s)', 'Voltage (V)', pen=pg.mkPen())
+
+
+@pytest.mark.parametrize("axis, result", (
+    ('Voltage (V)', ('Voltage ', 'V')),
+    ('Iteration', ('Iteration', None)),
+    (None, (None, None)),
+))
+def test_parse_axis(plot_frame, axis, result):
+    assert plot_frame.parse_axis(axis) == result
+
+
+def test_results_items_follow_plot_items(plot_frame, curve):
+    other = pg.PlotDataItem()
+    plot_frame.plot.addItem(curve)
+    plot_frame.plot.addItem(other)
+    assert plot_frame.plot.results_items == [curve]
+    plot_frame.plot.removeItem(curve)
+    assert plot_frame.plot.results_items == []
+    plot_frame.plot.addItem(curve)
+    plot_frame.plot.clear()
+    assert plot_frame.plot.results_items == []
+
+
+def test_change_x_axis_updates_results_items(plot_frame, curve):
+    plot_frame.plot.addItem(curve)
+    plot_frame.change_x_axis('Voltage (V)')
+    assert curve.x == 'Voltage (V)'
+    assert curve.getData()[0].tolist() == [2., 3.]
+
+
+def test_refresh_paused_while_hidden(qtbot, plot_frame, curve):
+    plot_frame.plot.addItem(curve)
+    plot_frame.check_status = False
+    plot_frame.show()
+    qtbot.waitExposed(plot_frame)
+    assert plot_frame.timer.isActive()
+    plot_frame.hide()
+    assert plot_frame.timer is None
+    with mock.patch.object(curve, 'update_data') as update_data:
+        plot_frame.update_curves()
+        update_data.assert_not_called()
+        plot_frame.show()
+        assert plot_frame.timer.isActive()
+        plot_frame.timer.timeout.emit()
+        update_data.assert_called_once()
+
+
+def test_frames_share_refresh_timer(qtbot, plot_frame):
+    other = PlotFrame('Time (s)', 'Voltage (V)')
+    qtbot.addWidget(other)
+    faster = PlotFrame('Time (s)', 'Voltage (V)', refresh_time=0.1)
+    qtbot.addWidget(faster)
+    for frame in (plot_frame, other, faster):
+        frame.show()
+    assert other.timer is plot_frame.timer
+    assert faster.timer is not plot_frame.timer
+    assert faster.timer.interval() == 100
+
+
+def test_refresh_timer_stopped_without_shown_frames(qtbot, plot_frame):
+    assert plot_frame.timer is None
+    other = PlotFrame('Time (s)', 'Voltage (V)')
+    qtbot.addWidget(other)
+    plot_frame.show()
+    other.show()
+    timer = plot_frame.timer
+    plot_frame.hide()
+    assert timer.isActive()
+    other.hide()
+    assert not timer.isActive()
+    other.show()
+    assert timer.isActive()
+
+
+def test_refresh_stops_after_timer_retimed(qtbot, plot_frame):
+    other = PlotFrame('Time (s)', 'Voltage (V)')
+    qtbot.addWidget(other)
+    plot_frame.show()
+    other.show()
+    timer = plot_frame.timer
+    timer.setInterval(500)
+    plot_frame.hide()
+    other.hide()
+    assert plot_frame.timer is None
+    assert not timer.isActive()
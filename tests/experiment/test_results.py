@@ -138,6 +138,23 @@ class TestResults:
         assert second_data.iloc[:, 0].dtype is not object
         assert first_data.iloc[:, 0].dtype is second_data.iloc[:, 0].dtype
 
+    def test_attr_data_should_only_read_file_when_changed(self, tmpdir):
+        class DummyProcedure(Procedure):
+            DATA_COLUMNS = ['Foo', 'Bar']
+        filename = os.path.join(str(tmpdir), 'data_unchanged_test.csv')
+        result = Results(DummyProcedure(), filename)
+        with open(filename, 'a') as f:
+            f.write(result.format({'Foo': 1, 'Bar': 2}) + Results.LINE_BREAK)
+        assert len(result.data) == 1
+
+        with mock.patch('pymeasure.experiment.results.pd.read_csv') as read_csv_mock:
+            assert len(result.data) == 1
+            read_csv_mock.assert_not_called()
+
+        with open(filename, 'a') as f:
+            f.write(result.format({'Foo': 3, 'Bar': 4}) + Results.LINE_BREAK)
+        assert result.data['Foo'].tolist() == [1, 3]
+
     def test_regression_param_str_should_not_include_newlines(self, tmpdir):
         class DummyProcedure(Procedure):
             par = Parameter('Generic Parameter with newline chars')